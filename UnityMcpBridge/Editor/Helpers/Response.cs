@@ -55,6 +55,33 @@ namespace UnityMcpBridge.Editor.Helpers
                 return new { success = false, error = errorMessage };
             }
         }
+
+        /// <summary>
+        /// Creates a response whose binary payload is sent raw after the JSON result instead of
+        /// being base64-encoded into it.
+        /// </summary>
+        /// <param name="result">The response object serialized as the JSON result.</param>
+        /// <param name="payload">The bytes sent in the response's binary part.</param>
+        /// <returns>An object the bridge unpacks into the two parts of the response.</returns>
+        public static BinaryResponse Binary(object result, byte[] payload)
+        {
+            return new BinaryResponse(result, payload);
+        }
+    }
+
+    /// <summary>
+    /// A command result paired with a binary payload. See <see cref="Response.Binary"/>.
+    /// </summary>
+    public sealed class BinaryResponse
+    {
+        public object Result { get; }
+        public byte[] Payload { get; }
+
+        public BinaryResponse(object result, byte[] payload)
+        {
+            Result = result;
+            Payload = payload;
+        }
     }
 }
 
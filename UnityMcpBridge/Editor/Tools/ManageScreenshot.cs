@@ -1,5 +1,7 @@
 using System;
 using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
 using System.Linq;
 using Newtonsoft.Json.Linq;
 using UnityEditor;
@@ -13,6 +15,21 @@ namespace UnityMcpBridge.Editor.Tools
     /// </summary>
     public static class ManageScreenshot
     {
+        // Shared memory handoff state: Windows named mappings only live while a handle
+        // is open, so the latest one is kept alive until the next capture releases it
+#if UNITY_EDITOR_WIN
+        private static MemoryMappedFile lastSharedImage;
+#elif UNITY_EDITOR_LINUX
+        private static string lastSharedImagePath;
+#endif
+        private static int sharedImageCounter;
+
+        private static readonly Dictionary<string, string> MimeTypesByFormat = new()
+        {
+            ["PNG"] = "image/png",
+            ["JPG"] = "image/jpeg",
+        };
+
         /// <summary>
         /// Main handler for screenshot management actions.
         /// </summary>
@@ -22,14 +39,17 @@ namespace UnityMcpBridge.Editor.Tools
             string cameraName = @params["cameraName"]?.ToString();
             int? width = @params["width"]?.ToObject<int?>();
             int? height = @params["height"]?.ToObject<int?>();
-            string format = @params["format"]?.ToString()?.ToUpper() ?? "PNG";
+            string format = @params["format"]?.ToString()?.ToUpper() ?? "JPG";
+            int quality = Mathf.Clamp(@params["quality"]?.ToObject<int?>() ?? 85, 1, 100);
+            string fit = @params["fit"]?.ToString()?.ToLower() ?? "contain";
+            string transport = @params["transport"]?.ToString()?.ToLower();
 
             try
             {
                 switch (action)
                 {
                     case "capture":
-                        return CaptureScreenshot(cameraName, width, height, format);
+                        return CaptureScreenshot(cameraName, width, height, fit, format, quality, transport);
                     
                     case "list_cameras":
                         return ListCameras();
@@ -49,8 +69,12 @@ namespace UnityMcpBridge.Editor.Tools
         /// <summary>
         /// Captures a screenshot from the specified camera (or main camera if none specified).
         /// </summary>
-        private static object CaptureScreenshot(string cameraName, int? width, int? height, string format)
+        private static object CaptureScreenshot(string cameraName, int? width, int? height, string fit, string format, int quality, string transport)
         {
+            // Whatever the transport, the server has read (or given up on) the previous
+            // shared image before sending this command, so it can go now
+            ReleaseSharedImage();
+
             try
             {
                 // Find the target camera
@@ -63,16 +87,21 @@ namespace UnityMcpBridge.Editor.Tools
                     return Response.Error(errorMsg);
                 }
 
-                // Determine screenshot dimensions
-                int screenshotWidth = width ?? (int)targetCamera.pixelWidth;
-                int screenshotHeight = height ?? (int)targetCamera.pixelHeight;
+                // Determine source dimensions
+                int sourceWidth = targetCamera.pixelWidth;
+                int sourceHeight = targetCamera.pixelHeight;
 
                 // Validate dimensions
-                if (screenshotWidth <= 0 || screenshotHeight <= 0)
+                if (sourceWidth <= 0 || sourceHeight <= 0)
                 {
-                    screenshotWidth = 1920; // Default width
-                    screenshotHeight = 1080; // Default height
+                    sourceWidth = 1920; // Default width
+                    sourceHeight = 1080; // Default height
                 }
+
+                // Render straight at the output size rather than resizing afterwards, so no
+                // pixels are produced only to be thrown away
+                (int screenshotWidth, int screenshotHeight) = FitDimensions(sourceWidth, sourceHeight, width, height, fit);
+
                 // Create render texture
                 RenderTexture renderTexture = new RenderTexture(screenshotWidth, screenshotHeight, 24);
                 RenderTexture.active = renderTexture;
@@ -91,33 +120,86 @@ namespace UnityMcpBridge.Editor.Tools
                     screenshot.ReadPixels(new Rect(0, 0, screenshotWidth, screenshotHeight), 0, 0);
                     screenshot.Apply();
 
-                    // Resize to 320x180 thumbnail for faster transmission
-                    Texture2D thumbnail = ResizeTexture(screenshot, 320, 180);
-                    
-                    // Clean up original full-size screenshot
-                    UnityEngine.Object.DestroyImmediate(screenshot);
-
-                    // Convert thumbnail to bytes based on format
+                    // Convert screenshot to bytes based on format
                     byte[] imageBytes;
                     string actualFormat;
                     
                     if (format == "JPG" || format == "JPEG")
                     {
-                        imageBytes = thumbnail.EncodeToJPG(75); // 75% quality
+                        imageBytes = screenshot.EncodeToJPG(quality);
                         actualFormat = "JPG";
                     }
                     else
                     {
-                        imageBytes = thumbnail.EncodeToPNG();
+                        imageBytes = screenshot.EncodeToPNG();
                         actualFormat = "PNG";
                     }
 
+                    // Clean up screenshot
+                    UnityEngine.Object.DestroyImmediate(screenshot);
+
+                    string mimeType = MimeTypesByFormat[actualFormat];
+                    var metadata = new
+                    {
+                        camera = targetCamera.name,
+                        width = screenshotWidth,
+                        height = screenshotHeight,
+                        sourceWidth = sourceWidth,
+                        sourceHeight = sourceHeight,
+                        format = actualFormat
+                    };
+
+                    // Hand the raw bytes over through shared memory when the server asked for it,
+                    // skipping base64 and the socket copy
+                    if (transport == "shm")
+                    {
+                        string shmName = TryWriteSharedImage(imageBytes);
+                        if (shmName != null)
+                        {
+                            return new
+                            {
+                                content = new object[]
+                                {
+                                    new
+                                    {
+                                        type = "image",
+                                        shmName = shmName,
+                                        size = imageBytes.Length,
+                                        mimeType = mimeType
+                                    }
+                                },
+                                metadata = metadata
+                            };
+                        }
+                    }
+
+                    // Otherwise send them raw in the response's binary part; servers that ask
+                    // for shared memory understand that too. Inline base64 is only for callers
+                    // that don't specify a transport.
+                    if (transport == "shm" || transport == "binary")
+                    {
+                        return Response.Binary(
+                            new
+                            {
+                                content = new object[]
+                                {
+                                    new
+                                    {
+                                        type = "image",
+                                        binary = true,
+                                        size = imageBytes.Length,
+                                        mimeType = mimeType
+                                    }
+                                },
+                                metadata = metadata
+                            },
+                            imageBytes
+                        );
+                    }
+
                     // Convert to base64
                     string base64Image = System.Convert.ToBase64String(imageBytes);
 
-                    // Clean up thumbnail
-                    UnityEngine.Object.DestroyImmediate(thumbnail);
-
                     // Return in proper MCP content format for LLM visual processing
                     return new
                     {
@@ -127,9 +209,10 @@ namespace UnityMcpBridge.Editor.Tools
                             {
                                 type = "image",
                                 data = base64Image,
-                                mimeType = actualFormat == "JPG" ? "image/jpeg" : "image/png"
+                                mimeType = mimeType
                             }
-                        }
+                        },
+                        metadata = metadata
                     };
                 }
                 finally
@@ -154,6 +237,64 @@ namespace UnityMcpBridge.Editor.Tools
             }
         }
 
+        /// <summary>
+        /// Writes encoded image bytes to a named shared memory block the Python server can open.
+        /// Returns the block's name, or null if shared memory isn't available on this platform.
+        /// </summary>
+        private static string TryWriteSharedImage(byte[] imageBytes)
+        {
+            try
+            {
+                string name = $"unity-mcp-screenshot-{System.Diagnostics.Process.GetCurrentProcess().Id}-{++sharedImageCounter}";
+#if UNITY_EDITOR_WIN
+                lastSharedImage = MemoryMappedFile.CreateNew(name, imageBytes.Length);
+                using (MemoryMappedViewStream view = lastSharedImage.CreateViewStream())
+                {
+                    view.Write(imageBytes, 0, imageBytes.Length);
+                }
+                return name;
+#elif UNITY_EDITOR_LINUX
+                // POSIX shared memory objects are files under /dev/shm
+                lastSharedImagePath = Path.Combine("/dev/shm", name);
+                File.WriteAllBytes(lastSharedImagePath, imageBytes);
+                return name;
+#else
+                return null;
+#endif
+            }
+            catch (Exception ex)
+            {
+                UnityEngine.Debug.LogWarning($"[ManageScreenshot] Shared memory unavailable, sending image inline: {ex.Message}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Frees the last shared memory image. The server unlinks each block after reading
+        /// it, so this only cleans up one it never picked up, e.g. when it can't open
+        /// shared memory at all and has fallen back to capturing over the socket.
+        /// </summary>
+        private static void ReleaseSharedImage()
+        {
+            try
+            {
+#if UNITY_EDITOR_WIN
+                lastSharedImage?.Dispose();
+                lastSharedImage = null;
+#elif UNITY_EDITOR_LINUX
+                if (lastSharedImagePath != null && File.Exists(lastSharedImagePath))
+                {
+                    File.Delete(lastSharedImagePath);
+                }
+                lastSharedImagePath = null;
+#endif
+            }
+            catch (Exception ex)
+            {
+                UnityEngine.Debug.LogWarning($"[ManageScreenshot] Failed to release shared image: {ex.Message}");
+            }
+        }
+
         /// <summary>
         /// Lists all cameras in the current scene.
         /// </summary>
@@ -168,7 +309,8 @@ namespace UnityMcpBridge.Editor.Tools
                     name = cam.name,
                     isMainCamera = cam.CompareTag("MainCamera"),
                     isActive = cam.gameObject.activeInHierarchy,
-                    resolution = $"{(int)cam.pixelWidth}x{(int)cam.pixelHeight}",
+                    width = cam.pixelWidth,
+                    height = cam.pixelHeight,
                     renderingPath = cam.renderingPath.ToString(),
                     depth = cam.depth
                 }).OrderByDescending(c => c.isMainCamera).ThenBy(c => c.name).ToArray();
@@ -235,35 +377,25 @@ namespace UnityMcpBridge.Editor.Tools
         }
 
         /// <summary>
-        /// Resizes a Texture2D to the specified dimensions using bilinear filtering.
+        /// Computes the capture size. "contain" scales the source down (never up) to fit within
+        /// the requested box, keeping its aspect ratio; "fill" uses the requested size as-is.
+        /// A missing dimension falls back to the source's.
         /// </summary>
-        private static Texture2D ResizeTexture(Texture2D original, int newWidth, int newHeight)
+        private static (int width, int height) FitDimensions(int sourceWidth, int sourceHeight, int? width, int? height, string fit)
         {
-            // Create a new texture with the target size
-            Texture2D resized = new Texture2D(newWidth, newHeight, TextureFormat.RGB24, false);
-            
-            // Calculate scaling factors
-            float xScale = (float)original.width / newWidth;
-            float yScale = (float)original.height / newHeight;
-            
-            // Sample pixels from original texture
-            for (int y = 0; y < newHeight; y++)
+            int boxWidth = width > 0 ? width.Value : sourceWidth;
+            int boxHeight = height > 0 ? height.Value : sourceHeight;
+
+            if (fit == "fill")
             {
-                for (int x = 0; x < newWidth; x++)
-                {
-                    // Calculate source coordinates with bilinear sampling
-                    float sourceX = x * xScale;
-                    float sourceY = y * yScale;
-                    
-                    // Get color using bilinear interpolation
-                    Color pixelColor = original.GetPixelBilinear(sourceX / original.width, sourceY / original.height);
-                    resized.SetPixel(x, y, pixelColor);
-                }
+                return (boxWidth, boxHeight);
             }
-            
-            // Apply changes
-            resized.Apply();
-            return resized;
+
+            float scale = Mathf.Min(1f, Mathf.Min((float)boxWidth / sourceWidth, (float)boxHeight / sourceHeight));
+            return (
+                Mathf.Max(1, Mathf.RoundToInt(sourceWidth * scale)),
+                Mathf.Max(1, Mathf.RoundToInt(sourceHeight * scale))
+            );
         }
     }
 } 
\ No newline at end of file
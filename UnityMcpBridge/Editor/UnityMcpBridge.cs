@@ -23,9 +23,22 @@ namespace UnityMcpBridge.Editor
         private static readonly object lockObj = new();
         private static Dictionary<
             string,
-            (string commandJson, TaskCompletionSource<string> tcs)
+            (string commandJson, TaskCompletionSource<(string json, byte[] payload)> tcs)
         > commandQueue = new();
         private static readonly int unityPort = 6400; // Hardcoded port
+        // Version of the framed response protocol (see WriteResponseAsync). A client
+        // opts in per connection by sending "ping <version>"; all others get plain
+        // JSON responses, as servers predating framing expect.
+        private const int ProtocolVersion = 2;
+#if UNITY_2021_2_OR_NEWER && !UNITY_EDITOR_WIN
+        // Local clients prefer this socket over TCP loopback; the Python server derives
+        // the same path from the temp directory and port
+        private static Socket unixListener;
+        private static readonly string unitySocketPath = Path.Combine(
+            Path.GetTempPath(),
+            $"unity-mcp-{unityPort}.sock"
+        );
+#endif
 
         public static bool IsRunning => isRunning;
 
@@ -80,6 +93,9 @@ namespace UnityMcpBridge.Editor
                 Debug.Log($"UnityMcpBridge started on port {unityPort}.");
                 // Assuming ListenerLoop and ProcessCommands are defined elsewhere
                 Task.Run(ListenerLoop);
+#if UNITY_2021_2_OR_NEWER && !UNITY_EDITOR_WIN
+                StartUnixListener();
+#endif
                 EditorApplication.update += ProcessCommands;
             }
             catch (SocketException ex)
@@ -108,6 +124,9 @@ namespace UnityMcpBridge.Editor
             {
                 listener?.Stop();
                 listener = null;
+#if UNITY_2021_2_OR_NEWER && !UNITY_EDITOR_WIN
+                StopUnixListener();
+#endif
                 isRunning = false;
                 EditorApplication.update -= ProcessCommands;
                 Debug.Log("UnityMcpBridge stopped.");
@@ -148,12 +167,95 @@ namespace UnityMcpBridge.Editor
             }
         }
 
+#if UNITY_2021_2_OR_NEWER && !UNITY_EDITOR_WIN
+        private static void StartUnixListener()
+        {
+            try
+            {
+                // A socket file left behind by a previous domain reload or crash would make Bind fail
+                if (File.Exists(unitySocketPath))
+                {
+                    File.Delete(unitySocketPath);
+                }
+
+                unixListener = new Socket(
+                    AddressFamily.Unix,
+                    SocketType.Stream,
+                    ProtocolType.Unspecified
+                );
+                unixListener.Bind(new UnixDomainSocketEndPoint(unitySocketPath));
+                unixListener.Listen(16);
+                Debug.Log($"UnityMcpBridge listening on {unitySocketPath}.");
+                Task.Run(UnixListenerLoop);
+            }
+            catch (Exception ex)
+            {
+                // Not fatal: clients fall back to the TCP listener
+                Debug.LogWarning($"Failed to start Unix socket listener: {ex.Message}");
+                unixListener?.Dispose();
+                unixListener = null;
+            }
+        }
+
+        private static void StopUnixListener()
+        {
+            unixListener?.Dispose();
+            unixListener = null;
+            try
+            {
+                if (File.Exists(unitySocketPath))
+                {
+                    File.Delete(unitySocketPath);
+                }
+            }
+            catch (Exception ex)
+            {
+                Debug.LogWarning($"Failed to remove {unitySocketPath}: {ex.Message}");
+            }
+        }
+
+        private static async Task UnixListenerLoop()
+        {
+            Socket currentListener = unixListener;
+            while (isRunning && currentListener == unixListener)
+            {
+                try
+                {
+                    Socket client = await currentListener.AcceptAsync();
+
+                    // Fire and forget each client connection
+                    _ = HandleUnixClientAsync(client);
+                }
+                catch (Exception ex)
+                {
+                    if (isRunning && currentListener == unixListener)
+                    {
+                        Debug.LogError($"Unix socket listener error: {ex.Message}");
+                    }
+                }
+            }
+        }
+
+        private static Task HandleUnixClientAsync(Socket client)
+        {
+            return HandleStreamAsync(new NetworkStream(client, ownsSocket: true));
+        }
+#endif
+
         private static async Task HandleClientAsync(TcpClient client)
         {
             using (client)
-            using (NetworkStream stream = client.GetStream())
+            {
+                await HandleStreamAsync(client.GetStream());
+            }
+        }
+
+        private static async Task HandleStreamAsync(NetworkStream stream)
+        {
+            using (stream)
             {
                 byte[] buffer = new byte[8192];
+                bool framed = false;
                 while (isRunning)
                 {
                     try
@@ -170,17 +272,28 @@ namespace UnityMcpBridge.Editor
                             bytesRead
                         );
                         string commandId = Guid.NewGuid().ToString();
-                        TaskCompletionSource<string> tcs = new();
+                        TaskCompletionSource<(string json, byte[] payload)> tcs = new();
 
                         // Special handling for ping command to avoid JSON parsing
-                        if (commandText.Trim() == "ping")
+                        string trimmedCommand = commandText.Trim();
+                        if (trimmedCommand == "ping" || trimmedCommand.StartsWith("ping "))
                         {
+                            // "ping <version>" is the protocol handshake; the reply
+                            // reports the version this bridge speaks
+                            if (int.TryParse(trimmedCommand[4..], out int requestedVersion))
+                            {
+                                framed = requestedVersion >= ProtocolVersion;
+                            }
+
                             // Direct response to ping without going through JSON parsing
-                            byte[] pingResponseBytes = System.Text.Encoding.UTF8.GetBytes(
+                            await WriteResponseAsync(
+                                stream,
+                                framed,
                                 /*lang=json,strict*/
-                                "{\"status\":\"success\",\"result\":{\"message\":\"pong\"}}"
+                                "{\"status\":\"success\",\"result\":{\"message\":\"pong\",\"protocol\":"
+                                    + ProtocolVersion
+                                    + "}}"
                             );
-                            await stream.WriteAsync(pingResponseBytes, 0, pingResponseBytes.Length);
                             continue;
                         }
 
@@ -189,9 +302,8 @@ namespace UnityMcpBridge.Editor
                             commandQueue[commandId] = (commandText, tcs);
                         }
 
-                        string response = await tcs.Task;
-                        byte[] responseBytes = System.Text.Encoding.UTF8.GetBytes(response);
-                        await stream.WriteAsync(responseBytes, 0, responseBytes.Length);
+                        (string response, byte[] payload) = await tcs.Task;
+                        await WriteResponseAsync(stream, framed, response, payload);
                     }
                     catch (Exception ex)
                     {
@@ -202,6 +314,47 @@ namespace UnityMcpBridge.Editor
             }
         }
 
+        // Framed responses are two length-prefixed parts (4-byte big-endian lengths): the
+        // JSON response, then a binary payload that is empty unless the command attached
+        // one. The server reads each part in as few reads as possible instead of
+        // re-parsing partial JSON, and binary data such as images skips base64 entirely.
+        // Unframed responses are the bare JSON; clients that never asked for framing
+        // never request a payload either.
+        private static async Task WriteResponseAsync(
+            NetworkStream stream,
+            bool framed,
+            string response,
+            byte[] payload = null
+        )
+        {
+            if (!framed)
+            {
+                byte[] responseBytes = System.Text.Encoding.UTF8.GetBytes(response);
+                await stream.WriteAsync(responseBytes, 0, responseBytes.Length);
+                return;
+            }
+
+            int jsonLength = System.Text.Encoding.UTF8.GetByteCount(response);
+            int payloadLength = payload?.Length ?? 0;
+            byte[] frame = new byte[8 + jsonLength];
+            WriteLength(frame, 0, jsonLength);
+            System.Text.Encoding.UTF8.GetBytes(response, 0, response.Length, frame, 4);
+            WriteLength(frame, 4 + jsonLength, payloadLength);
+            await stream.WriteAsync(frame, 0, frame.Length);
+            if (payloadLength > 0)
+            {
+                await stream.WriteAsync(payload, 0, payloadLength);
+            }
+        }
+
+        private static void WriteLength(byte[] buffer, int offset, int length)
+        {
+            buffer[offset] = (byte)(length >> 24);
+            buffer[offset + 1] = (byte)(length >> 16);
+            buffer[offset + 2] = (byte)(length >> 8);
+            buffer[offset + 3] = (byte)length;
+        }
+
         private static void ProcessCommands()
         {
             List<string> processedIds = new();
@@ -210,13 +363,13 @@ namespace UnityMcpBridge.Editor
                 foreach (
                     KeyValuePair<
                         string,
-                        (string commandJson, TaskCompletionSource<string> tcs)
+                        (string commandJson, TaskCompletionSource<(string json, byte[] payload)> tcs)
                     > kvp in commandQueue.ToList()
                 )
                 {
                     string id = kvp.Key;
                     string commandText = kvp.Value.commandJson;
-                    TaskCompletionSource<string> tcs = kvp.Value.tcs;
+                    TaskCompletionSource<(string json, byte[] payload)> tcs = kvp.Value.tcs;
 
                     try
                     {
@@ -228,7 +381,7 @@ namespace UnityMcpBridge.Editor
                                 status = "error",
                                 error = "Empty command received",
                             };
-                            tcs.SetResult(JsonConvert.SerializeObject(emptyResponse));
+                            tcs.SetResult((JsonConvert.SerializeObject(emptyResponse), null));
                             processedIds.Add(id);
                             continue;
                         }
@@ -244,7 +397,7 @@ namespace UnityMcpBridge.Editor
                                 status = "success",
                                 result = new { message = "pong" },
                             };
-                            tcs.SetResult(JsonConvert.SerializeObject(pingResponse));
+                            tcs.SetResult((JsonConvert.SerializeObject(pingResponse), null));
                             processedIds.Add(id);
                             continue;
                         }
@@ -260,7 +413,7 @@ namespace UnityMcpBridge.Editor
                                     ? commandText[..50] + "..."
                                     : commandText,
                             };
-                            tcs.SetResult(JsonConvert.SerializeObject(invalidJsonResponse));
+                            tcs.SetResult((JsonConvert.SerializeObject(invalidJsonResponse), null));
                             processedIds.Add(id);
                             continue;
                         }
@@ -275,12 +428,12 @@ namespace UnityMcpBridge.Editor
                                 error = "Command deserialized to null",
                                 details = "The command was valid JSON but could not be deserialized to a Command object",
                             };
-                            tcs.SetResult(JsonConvert.SerializeObject(nullCommandResponse));
+                            tcs.SetResult((JsonConvert.SerializeObject(nullCommandResponse), null));
                         }
                         else
                         {
-                            string responseJson = ExecuteCommand(command);
-                            tcs.SetResult(responseJson);
+                            string responseJson = ExecuteCommand(command, out byte[] payload);
+                            tcs.SetResult((responseJson, payload));
                         }
                     }
                     catch (Exception ex)
@@ -297,7 +450,7 @@ namespace UnityMcpBridge.Editor
                                 : commandText,
                         };
                         string responseJson = JsonConvert.SerializeObject(response);
-                        tcs.SetResult(responseJson);
+                        tcs.SetResult((responseJson, null));
                     }
 
                     processedIds.Add(id);
@@ -339,8 +492,9 @@ namespace UnityMcpBridge.Editor
             return false;
         }
 
-        private static string ExecuteCommand(Command command)
+        private static string ExecuteCommand(Command command, out byte[] payload)
         {
+            payload = null;
             try
             {
                 if (string.IsNullOrEmpty(command.type))
@@ -387,6 +541,13 @@ namespace UnityMcpBridge.Editor
                     ),
                 };
 
+                // Handlers attach binary data (e.g. screenshots) to be sent after the JSON
+                if (result is BinaryResponse binary)
+                {
+                    payload = binary.Payload;
+                    result = binary.Result;
+                }
+
                 // Standard success response format
                 var response = new { status = "success", result };
                 
@@ -412,6 +573,8 @@ namespace UnityMcpBridge.Editor
             }
             catch (Exception ex)
             {
+                payload = null;
+
                 // Log the detailed error in Unity for debugging
                 Debug.LogError(
                     $"Error executing command '{command?.type ?? "Unknown"}': {ex.Message}\n{ex.StackTrace}"
@@ -3,7 +3,10 @@ Configuration settings for the Unity MCP Server.
 This file contains all configurable parameters for the server.
 """
 
+import os
+import tempfile
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class ServerConfig:
@@ -13,10 +16,18 @@ class ServerConfig:
     unity_host: str = "localhost"
     unity_port: int = 6400
     mcp_port: int = 6500
+    # Unix domain socket the bridge also listens on (macOS/Linux); derived from
+    # unity_port when unset, the same way UnityMcpBridge derives it
+    unity_socket_path: Optional[str] = None
     
     # Connection settings
     connection_timeout: float = 86400.0  # 24 hours timeout
-    buffer_size: int = 16 * 1024 * 1024  # 16MB buffer
+    buffer_size: int = 64 * 1024  # 64KB per read, where IPC throughput peaks
+    # SO_SNDBUF/SO_RCVBUF for the Unity socket; None keeps the kernel default, which
+    # on Linux auto-tunes the receive buffer (setting it explicitly turns that off)
+    socket_buffer_size: Optional[int] = None
+    max_response_bytes: int = 128 * 1024 * 1024  # 128MB, responses beyond this are rejected
+    large_command_warning_bytes: int = 8 * 1024 * 1024  # 8MB, commands beyond this log a warning
     
     # Logging settings
     log_level: str = "INFO"
@@ -26,5 +37,9 @@ class ServerConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
 
+    def __post_init__(self):
+        if self.unity_socket_path is None:
+            self.unity_socket_path = os.path.join(tempfile.gettempdir(), f"unity-mcp-{self.unity_port}.sock")
+
 # Create a global config instance
 config = ServerConfig() 
\ No newline at end of file
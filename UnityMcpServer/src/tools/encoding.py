@@ -0,0 +1,11 @@
+"""Base64 codec shared by the tools.
+
+pybase64 is a SIMD-accelerated drop-in replacement for the stdlib functions; the
+stdlib is used when it is unavailable (e.g. no wheel for the platform).
+"""
+try:
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from base64 import b64decode, b64encode
+
+__all__ = ["b64decode", "b64encode"]
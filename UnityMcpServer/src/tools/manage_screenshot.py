@@ -1,77 +1,256 @@
-from mcp.server.fastmcp import FastMCP, Context, Image
-from typing import Dict, Any, List
-import base64
+from mcp.server.fastmcp import FastMCP, Context
+from mcp.types import ImageContent, TextContent
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import logging
+import os
+import threading
+import time
+from multiprocessing import shared_memory
+from config import config
 from unity_connection import get_unity_connection
+from .encoding import b64encode
+
+logger = logging.getLogger("unity-mcp-server")
+
+_MIME_BY_FORMAT = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg"}
+
+# Agents often re-request the same view within moments while reasoning about the last
+# one, so recent captures are reused. The TTL is kept short so scene changes show up.
+_CAPTURE_CACHE_SIZE = 4
+_CAPTURE_CACHE_TTL = 0.25  # seconds
+_capture_cache = OrderedDict()  # capture key -> (monotonic timestamp, image, metadata)
+_capture_cache_lock = threading.Lock()
+
+# Unity can hand captured images over through shared memory instead of the socket when
+# it runs on this machine: a named file mapping on Windows, a /dev/shm object on Linux
+_SHARED_MEMORY_SUPPORTED = (
+    config.unity_host in ("localhost", "127.0.0.1")
+    and (os.name == "nt" or os.path.isdir("/dev/shm"))
+)
+
+@dataclass(slots=True)
+class ScreenshotResult:
+    """Result envelope for non-image responses; serializes like the usual result dict."""
+    success: bool
+    message: str
+    data: Any = None
+
+def _base64_decoded_size(base64_data: str) -> int:
+    """Return the decoded byte size of a base64 string without decoding it."""
+    # Only the trailing padding needs inspecting, never the whole payload
+    return (len(base64_data) * 3 >> 2) - base64_data.count("=", -2)
+
+def _read_shared_image(name: str, size: int) -> str:
+    """Read an image Unity left in shared memory and return it base64-encoded."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # Encode straight from the mapped view, without copying it out first
+        with shm.buf[:size] as view:
+            return b64encode(view).decode("ascii")
+    finally:
+        shm.close()
+        # Ownership passes to us once read; Windows frees the mapping on its own
+        if os.name != "nt":
+            shm.unlink()
+
+def _capture_key(params: Dict[str, Any]) -> tuple:
+    """Key identifying a capture by the parameters that affect the image."""
+    return tuple(params.get(k) for k in ("cameraName", "width", "height", "fit", "format", "quality"))
+
+def _get_cached_capture(key: tuple) -> Optional[Tuple[ImageContent, Optional[dict]]]:
+    """Return a capture made with the same parameters within the TTL, if any."""
+    with _capture_cache_lock:
+        entry = _capture_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _CAPTURE_CACHE_TTL:
+            del _capture_cache[key]
+            return None
+        _capture_cache.move_to_end(key)
+        return entry[1], entry[2]
+
+def _cache_capture(key: tuple, image: ImageContent, metadata: Optional[dict]):
+    """Remember a capture, evicting the least recently used one when full."""
+    with _capture_cache_lock:
+        _capture_cache[key] = (time.monotonic(), image, metadata)
+        _capture_cache.move_to_end(key)
+        while len(_capture_cache) > _CAPTURE_CACHE_SIZE:
+            _capture_cache.popitem(last=False)
+
+def _clear_capture_cache():
+    with _capture_cache_lock:
+        _capture_cache.clear()
+
+def _capture_result(image: ImageContent, metadata: Optional[dict]):
+    """Return the image, with a short note for the model when it was scaled down.
+
+    Full metadata only reaches the client's log, but the model needs the camera's true
+    resolution to relate what it sees to screen coordinates.
+    """
+    if metadata and "sourceWidth" in metadata and (
+        (metadata["sourceWidth"], metadata["sourceHeight"]) != (metadata["width"], metadata["height"])
+    ):
+        note = (
+            f"Captured at {metadata['width']}x{metadata['height']}, scaled down from the "
+            f"camera's {metadata['sourceWidth']}x{metadata['sourceHeight']}."
+        )
+        return [image, TextContent(type="text", text=note)]
+    return image
+
+async def _handle_capture(ctx: Context, response: Dict[str, Any], params: Dict[str, Any]):
+    """Turn Unity's capture response into MCP image content, caching it and logging its metadata.
+
+    Raises OSError if an image handed over through shared memory can't be read.
+    """
+    # Find the image content in the array
+    for item in response.get("content", ()):
+        if item.get("type") == "image":
+            mime_type = item.get("mimeType") or _MIME_BY_FORMAT.get(str(params.get("format", "png")).lower(), "image/png")
+            if "shmName" in item:
+                size = item["size"]
+                base64_data = _read_shared_image(item["shmName"], size)
+            elif item.get("binary"):
+                # Raw bytes from the response's binary part; base64 only once, here,
+                # because MCP image content requires it
+                binary_data = response.get("binaryData")
+                if not binary_data:
+                    return ScreenshotResult(False, "Unity reported a binary image but sent no image data.")
+                size = len(binary_data)
+                base64_data = b64encode(binary_data).decode("ascii")
+            else:
+                # Unity already sends base64, which is exactly what MCP image
+                # content carries, so pass it through without decoding it to
+                # bytes only for FastMCP's Image to re-encode it.
+                base64_data = item.get("data", "")
+                size = _base64_decoded_size(base64_data)
+            logger.info(f"Screenshot captured ({size} bytes, {mime_type})")
+
+            image = ImageContent(type="image", data=base64_data, mimeType=mime_type)
+            metadata = response.get("metadata")
+            _cache_capture(_capture_key(params), image, metadata)
+
+            # Report the full metadata alongside rather than inside the result
+            if metadata is not None:
+                await ctx.info(f"Screenshot metadata: {json.dumps(metadata)}")
+            return _capture_result(image, metadata)
+
+    if "content" in response:
+        # If no image found, fall back to text response
+        return ScreenshotResult(True, "Screenshot captured but no image data found.", response)
+    # Error responses (e.g. camera not found) carry no content
+    return await _handle_generic(ctx, response, params)
+
+async def _handle_generic(ctx: Context, response: Dict[str, Any], params: Dict[str, Any]) -> ScreenshotResult:
+    """Wrap a response for other actions (like list_cameras) or errors in the result envelope."""
+    return ScreenshotResult(
+        response.get("success", False),
+        response.get("message") or response.get("error") or "Screenshot operation completed.",
+        response.get("data", {})
+    )
+
+# Post-processing for Unity's response by action; anything unlisted goes to _handle_generic
+_ACTION_HANDLERS = {
+    "capture": _handle_capture,
+}
 
 def register_manage_screenshot_tools(mcp: FastMCP):
     """Register all screenshot management tools with the MCP server."""
+    # Resolved lazily and reused across calls: get_unity_connection() pings Unity
+    # every time it's called, which would add a round-trip to every capture.
+    connection = None
+    # Cleared for the rest of the session if a shared memory handoff ever fails
+    use_shared_memory = _SHARED_MEMORY_SUPPORTED
 
     @mcp.tool()
-    def manage_screenshot(
+    async def manage_screenshot(
         ctx: Context,
         action: str = "capture",
         camera_name: str = None,
-        width: int = None,
-        height: int = None,
-        format: str = "PNG"
+        width: Optional[int] = 320,
+        height: Optional[int] = 180,
+        fit: str = "contain",
+        format: str = "JPG",
+        quality: int = 85
     ):
         """Takes screenshots of Unity cameras and returns them as images.
 
         Args:
             action: Operation (e.g., 'capture', 'list_cameras').
             camera_name: Name of the camera to capture from (defaults to main camera).
-            width: Screenshot width in pixels (defaults to camera resolution).
-            height: Screenshot height in pixels (defaults to camera resolution).
-            format: Image format ('PNG' or 'JPG').
+            width: Maximum screenshot width in pixels (None or 0 for the camera's resolution).
+            height: Maximum screenshot height in pixels (None or 0 for the camera's resolution).
+                The 320x180 default keeps captures small (exactly 320x180 for a 16:9
+                camera); ask for up to 1024x1024 when more detail is needed, as vision
+                models downscale anything larger to about that size.
+            fit: 'contain' to scale the camera's image down to fit within width x height,
+                keeping its aspect ratio, or 'fill' to capture at exactly width x height.
+            format: Image format ('JPG' or 'PNG'). JPG is much smaller and vision models
+                handle it well; use PNG only when lossless output is needed.
+            quality: JPG quality from 1 to 100 (ignored for PNG).
 
         Returns:
-            Dictionary with operation results ('success', 'message', 'data').
-            For 'capture' action, includes the screenshot as visual content the LLM can process.
+            For 'capture', the screenshot as image content the LLM can process, followed
+            by a one-line note with the camera's resolution when the image was scaled
+            down. The full metadata (camera, size, source resolution) is sent as a log
+            message.
+            Otherwise the operation results ('success', 'message', 'data').
         """
+        nonlocal connection, use_shared_memory
         try:
-            # Prepare parameters, removing None values
-            params = {
-                "action": action,
-                "cameraName": camera_name,
-                "width": width,
-                "height": height,
-                "format": format,
-            }
-            params = {k: v for k, v in params.items() if v is not None}
-            
-            # Send command to Unity
-            response = get_unity_connection().send_command("manage_screenshot", params)
-
-            # Unity now returns proper MCP content format directly
-            if "content" in response:
-                # Extract image data from Unity response and return as FastMCP Image
-                content_array = response["content"]
-                
-                # Find the image content in the array
-                for item in content_array:
-                    if item.get("type") == "image":
-                        # Get base64 data and mime type from Unity
-                        base64_data = item.get("data", "")
-                        mime_type = item.get("mimeType", "image/png")
-                        
-                        # Convert base64 to bytes for FastMCP
-                        img_bytes = base64.b64decode(base64_data)
-                        
-                        # Extract format from mime type (e.g., "image/png" -> "png")
-                        format_type = mime_type.split("/")[-1] if "/" in mime_type else "png"
-                        
-                        # Return using FastMCP Image class
-                        return Image(data=img_bytes, format=format_type)
-                
-                # If no image found, fall back to text response
-                return {"success": True, "message": "Screenshot captured but no image data found.", "data": response}
+            # Prepare parameters, only adding optional ones that were given
+            params = {"action": action}
+            if camera_name is not None:
+                params["cameraName"] = camera_name
+            if width is not None:
+                params["width"] = width
+            if height is not None:
+                params["height"] = height
+            if fit is not None:
+                params["fit"] = fit
+            if format is not None:
+                params["format"] = format
+            if quality is not None:
+                params["quality"] = quality
+
+            if action == "capture":
+                cached = _get_cached_capture(_capture_key(params))
+                if cached is not None:
+                    image, metadata = cached
+                    if metadata is not None:
+                        await ctx.info(f"Screenshot metadata (cached): {json.dumps(metadata)}")
+                    return _capture_result(image, metadata)
+                params["transport"] = "shm" if use_shared_memory else "binary"
             else:
-                # Fallback for other actions (like list_cameras) or error responses
-                return {
-                    "success": response.get("success", False),
-                    "message": response.get("message", "Screenshot operation completed."),
-                    "data": response.get("data", {})
-                }
+                # Other actions may precede scene changes; don't risk serving a stale view
+                _clear_capture_cache()
+            
+            # Send command to Unity, re-resolving the connection if it has dropped its
+            # socket (send_command clears it on any communication failure)
+            if connection is None or connection.sock is None:
+                connection = get_unity_connection()
+            try:
+                response = connection.send_command("manage_screenshot", params)
+            except ConnectionError as e:
+                # Without the ping a stale socket (e.g. after a Unity domain reload)
+                # only shows up here; reconnect through get_unity_connection() and
+                # resend once. Errors from Unity itself would only fail again.
+                logger.warning(f"Screenshot command failed, reconnecting and retrying: {str(e)}")
+                connection = get_unity_connection()
+                response = connection.send_command("manage_screenshot", params)
+
+            try:
+                return await _ACTION_HANDLERS.get(action, _handle_generic)(ctx, response, params)
+            except OSError as e:
+                if params.get("transport") != "shm":
+                    raise
+                # E.g. Unity and the server don't share a namespace (containers);
+                # capture again with the image sent over the socket
+                logger.warning(f"Shared memory handoff failed, falling back to socket: {str(e)}")
+                use_shared_memory = False
+                return await manage_screenshot(ctx, action, camera_name, width, height, fit, format, quality)
 
         except Exception as e:
-            return {"success": False, "message": f"Python error managing screenshot: {str(e)}"} 
\ No newline at end of file
+            return ScreenshotResult(False, f"Python error managing screenshot: {str(e)}")
@@ -2,7 +2,7 @@ from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any
 from unity_connection import get_unity_connection
 import os
-import base64
+from .encoding import b64decode, b64encode
 
 def register_manage_shader_tools(mcp: FastMCP):
     """Register all shader script management tools with the MCP server."""
@@ -38,7 +38,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             if contents is not None:
                 if action in ['create', 'update']:
                     # Encode content for safer transmission
-                    params["encodedContents"] = base64.b64encode(contents.encode('utf-8')).decode('utf-8')
+                    params["encodedContents"] = b64encode(contents.encode('utf-8')).decode('utf-8')
                     params["contentsEncoded"] = True
                 else:
                     params["contents"] = contents
@@ -53,7 +53,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             if response.get("success"):
                 # If the response contains base64 encoded content, decode it
                 if response.get("data", {}).get("contentsEncoded"):
-                    decoded_contents = base64.b64decode(response["data"]["encodedContents"]).decode('utf-8')
+                    decoded_contents = b64decode(response["data"]["encodedContents"]).decode('utf-8')
                     response["data"]["contents"] = decoded_contents
                     del response["data"]["encodedContents"]
                     del response["data"]["contentsEncoded"]
@@ -1,8 +1,16 @@
+import os
 import socket
 import json
 import logging
+try:
+    # Much faster parser for large responses; like json.loads it takes the raw bytes,
+    # and its errors subclass json.JSONDecodeError. The stdlib covers platforms
+    # without an orjson wheel.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from config import config
 
 # Configure logging using settings from config
@@ -12,11 +20,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("unity-mcp-server")
 
+# Version of the framed response protocol (see receive_full_response), requested from
+# the bridge when connecting; bridges that predate it only send plain JSON
+PROTOCOL_VERSION = 2
+
 @dataclass
 class UnityConnection:
     """Manages the socket connection to the Unity Editor."""
     host: str = config.unity_host
     port: int = config.unity_port
+    socket_path: str = config.unity_socket_path
     sock: socket.socket = None  # Socket for Unity communication
 
     def connect(self) -> bool:
@@ -24,15 +37,76 @@ class UnityConnection:
         if self.sock:
             return True
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Unity at {self.host}:{self.port}")
+            if not self._connect_unix():
+                self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._configure_buffers(self.sock)
+                self.sock.connect((self.host, self.port))
+                logger.info(f"Connected to Unity at {self.host}:{self.port}")
+            self._negotiate_protocol()
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Unity: {str(e)}")
+            if self.sock:
+                self.sock.close()
             self.sock = None
             return False
 
+    def _connect_unix(self) -> bool:
+        """Connect over the bridge's Unix domain socket when Unity is local and exposes one.
+
+        This skips the TCP/IP stack entirely, which matters for large payloads such as
+        screenshots. Falls back to TCP (by returning False) on any failure.
+        """
+        if not hasattr(socket, "AF_UNIX") or self.host not in ("localhost", "127.0.0.1"):
+            return False
+        if not os.path.exists(self.socket_path):
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._configure_buffers(sock)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            logger.warning(f"Failed to connect to Unity socket {self.socket_path}, falling back to TCP: {str(e)}")
+            sock.close()
+            return False
+        self.sock = sock
+        logger.info(f"Connected to Unity at {self.socket_path}")
+        return True
+
+    def _configure_buffers(self, sock: socket.socket):
+        """Size a socket's kernel buffers when config.socket_buffer_size is set.
+
+        Must run before connect(): TCP agrees on the window scale during the handshake,
+        so a receive buffer set afterwards can't grow the window beyond it.
+        """
+        if config.socket_buffer_size is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, config.socket_buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, config.socket_buffer_size)
+        except OSError as e:
+            # Only a tuning hint; the kernel defaults still work
+            logger.debug(f"Could not set socket buffer sizes: {str(e)}")
+
+    def _negotiate_protocol(self):
+        """Ask the bridge to frame its responses on this connection.
+
+        The handshake is a ping carrying PROTOCOL_VERSION. Bridges that predate framing
+        reject it as invalid JSON with a plain JSON error, which is told apart from a
+        framed reply by its first byte: a length prefix never starts with '{'.
+        """
+        self.sock.sendall(f"ping {PROTOCOL_VERSION}".encode("ascii"))
+        self.sock.settimeout(config.connection_timeout)
+        if self.sock.recv(1, socket.MSG_PEEK) == b"{":
+            raise ConnectionError(
+                f"Unity MCP Bridge does not support protocol version {PROTOCOL_VERSION}; "
+                "update the Unity MCP Bridge package"
+            )
+        response_data, _ = self.receive_full_response(self.sock)
+        protocol = json_loads(response_data).get("result", {}).get("protocol")
+        if protocol != PROTOCOL_VERSION:
+            raise ConnectionError(f"Unity MCP Bridge speaks protocol version {protocol}, expected {PROTOCOL_VERSION}")
+
     def disconnect(self):
         """Close the connection to the Unity Editor."""
         if self.sock:
@@ -43,56 +117,22 @@ class UnityConnection:
             finally:
                 self.sock = None
 
-    def receive_full_response(self, sock, buffer_size=config.buffer_size) -> bytes:
-        """Receive a complete response from Unity, handling chunked data."""
-        chunks = []
+    def receive_full_response(self, sock, buffer_size=config.buffer_size) -> Tuple[bytearray, bytearray]:
+        """Receive a complete response from Unity as (JSON body, binary payload).
+
+        Responses are two parts, each framed with a 4-byte big-endian length prefix (the
+        protocol negotiated in connect): the JSON response, then a binary payload that is
+        empty unless the command attached one (e.g. screenshot bytes, which then skip
+        base64). The first read usually covers both prefixes and the JSON, so a typical
+        response costs a single recv.
+        """
         sock.settimeout(config.connection_timeout)  # Use timeout from config
         try:
-            while True:
-                chunk = sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
-                
-                # Check if we've received a complete response
-                try:
-                    # Special case for ping-pong
-                    if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
-                        logger.debug("Received ping response")
-                        return data
-                    
-                    # Handle escaped quotes in the content (DISABLED for large responses to prevent corruption)
-                    # Note: This logic is problematic for complex JSON with base64 data
-                    # The rfind() approach incorrectly finds quotes from other parts of the JSON
-                    if '"content":' in decoded_data:
-                        # Find the content field and its value
-                        content_start = decoded_data.find('"content":') + 9
-                        content_end = decoded_data.rfind('"', content_start)
-                        if content_end > content_start:
-                            # Replace escaped quotes in content with regular quotes
-                            content = decoded_data[content_start:content_end]
-                            content = content.replace('\\"', '"')
-                            decoded_data = decoded_data[:content_start] + content + decoded_data[content_end:]
-                    
-                    # Validate JSON format
-                    json.loads(decoded_data)
-                    
-                    # If we get here, we have valid JSON
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # We haven't received a complete valid JSON response yet
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    # Continue reading more chunks as this might not be the complete response
-                    continue
+            pending = bytearray()
+            body = self._receive_part(sock, pending, buffer_size, config.max_response_bytes)
+            payload = self._receive_part(sock, pending, buffer_size, config.max_response_bytes - len(body))
+            logger.info(f"Received complete response ({len(body)} bytes, {len(payload)} binary)")
+            return body, payload
         except socket.timeout:
             logger.warning("Socket timeout during receive")
             raise Exception("Timeout receiving Unity response")
@@ -100,6 +140,39 @@ class UnityConnection:
             logger.error(f"Error during receive: {str(e)}")
             raise
 
+    def _receive_part(self, sock, pending: bytearray, buffer_size: int, max_length: int) -> bytearray:
+        """Read one length-prefixed part of a response, consuming already-received bytes first.
+
+        The remainder is read in buffer_size chunks straight into a buffer preallocated
+        from the length prefix. Parts longer than max_length are rejected before anything
+        is allocated for them.
+        """
+        while len(pending) < 4:
+            chunk = sock.recv(buffer_size)
+            if not chunk:
+                raise ConnectionError("Connection closed before receiving data")
+            pending += chunk
+
+        length = int.from_bytes(pending[:4], "big")
+        if length > max_length:
+            # The rest of the oversized response is still in flight, so the socket can't be
+            # reused. Deliberately not a ConnectionError: resending would only make Unity
+            # produce the same oversized response again.
+            sock.close()
+            raise Exception(f"Response too large ({length} bytes, limit {max_length})")
+        part = bytearray(length)
+        received = min(len(pending) - 4, length)
+        part[:received] = pending[4:4 + received]
+        del pending[:4 + received]
+
+        view = memoryview(part)
+        while received < length:
+            n = sock.recv_into(view[received:], min(buffer_size, length - received))
+            if not n:
+                raise ConnectionError(f"Connection closed after {received} of {length} bytes")
+            received += n
+        return part
+
     def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a command to Unity and return its response."""
         if not self.sock and not self.connect():
@@ -110,8 +183,8 @@ class UnityConnection:
             try:
                 logger.debug("Sending ping to verify connection")
                 self.sock.sendall(b"ping")
-                response_data = self.receive_full_response(self.sock)
-                response = json.loads(response_data.decode('utf-8'))
+                response_data, _ = self.receive_full_response(self.sock)
+                response = json_loads(response_data)
                 
                 if response.get("status") != "success":
                     logger.warning("Ping response was not successful")
@@ -130,7 +203,7 @@ class UnityConnection:
             # Check for very large content that might cause JSON issues
             command_size = len(json.dumps(command))
             
-            if command_size > config.buffer_size / 2:
+            if command_size > config.large_command_warning_bytes:
                 logger.warning(f"Large command detected ({command_size} bytes). This might cause issues.")
                 
             logger.info(f"Sending command: {command_type} with params size: {command_size} bytes")
@@ -140,10 +213,10 @@ class UnityConnection:
             command_json = json.dumps(command, ensure_ascii=False)
             self.sock.sendall(command_json.encode('utf-8'))
             
-            response_data = self.receive_full_response(self.sock)
+            response_data, payload = self.receive_full_response(self.sock)
             
             try:
-                response = json.loads(response_data.decode('utf-8'))
+                response = json_loads(response_data)
             except json.JSONDecodeError as je:
                 logger.error(f"JSON decode error: {str(je)}")
                 # Log partial response for debugging
@@ -156,10 +229,18 @@ class UnityConnection:
                 logger.error(f"Unity error: {error_message}")
                 raise Exception(error_message)
             
-            return response.get("result", {})
+            result = response.get("result", {})
+            if payload:
+                # Raw binary part of the response (e.g. screenshot bytes), kept out of the JSON
+                result["binaryData"] = payload
+            return result
         except Exception as e:
             logger.error(f"Communication error with Unity: {str(e)}")
             self.sock = None
+            if isinstance(e, OSError) and not isinstance(e, socket.timeout):
+                # The transport failed (closed, reset, broken pipe) rather than Unity
+                # answering badly; callers may reconnect and resend on this type alone
+                raise ConnectionError(f"Failed to communicate with Unity: {str(e)}")
             raise Exception(f"Failed to communicate with Unity: {str(e)}")
 
 # Global Unity connection